@@ -34,6 +34,7 @@ from exabgp.bgp.message.update.nlri import NLRI
 
 from exabgp.logger import Logger
 from exabgp.logger import LazyFormat
+from exabgp.logger import LazyText
 
 # ======================================================================= Update
 
@@ -238,14 +239,14 @@ class Update (Message):
 		nlris = []
 		while withdrawn:
 			nlri,left = NLRI.unpack_nlri(AFI.ipv4,SAFI.unicast,withdrawn,IN.WITHDRAWN,addpath)
-			logger.debug('withdrawn NLRI %s' % nlri,'routes')
+			logger.debug(LazyText('withdrawn NLRI %s',nlri),'routes')
 			withdrawn = left
 			nlris.append(nlri)
 
 		while announced:
 			nlri,left = NLRI.unpack_nlri(AFI.ipv4,SAFI.unicast,announced,IN.ANNOUNCED,addpath)
 			nlri.nexthop = nexthop
-			logger.debug('announced NLRI %s' % nlri,'routes')
+			logger.debug(LazyText('announced NLRI %s',nlri),'routes')
 			announced = left
 			nlris.append(nlri)
 
@@ -23,6 +23,7 @@ class NLRI (Family):
 	EOR = False
 
 	registered_nlri = dict()
+	_unpacker = dict()
 	registered_families = [(AFI.ipv4, SAFI.multicast)]
 	logger = None
 
@@ -77,6 +78,7 @@ class NLRI (Family):
 	def register (cls, afi, safi, force=False):
 		def register_nlri (klass):
 			new = (AFI.create(afi),SAFI.create(safi))
+			cls._unpacker.pop(new,None)
 			if new in cls.registered_nlri:
 				if force:
 					# python has a bug and does not allow %ld/%ld (pypy does)
@@ -104,7 +106,12 @@ class NLRI (Family):
 		a,s = AFI.create(afi),SAFI.create(safi)
 		cls.logger.debug(LazyNLRI(a,s,addpath,data),'parser')
 
-		key = '%s/%s' % (a, s)
-		if key in cls.registered_nlri:
-			return cls.registered_nlri[key].unpack_nlri(a,s,data,action,addpath)
-		raise Notify(3,0,'trying to decode unknown family %s/%s' % (a,s))
+		# called for every prefix, so the name of the family is only built once per family
+		klass = cls._unpacker.get((a,s),None)
+		if klass is None:
+			key = '%s/%s' % (a, s)
+			if key not in cls.registered_nlri:
+				raise Notify(3,0,'trying to decode unknown family %s/%s' % (a,s))
+			klass = cls.registered_nlri[key]
+			cls._unpacker[(a,s)] = klass
+		return klass.unpack_nlri(a,s,data,action,addpath)
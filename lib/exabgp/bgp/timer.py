@@ -25,6 +25,7 @@ class ReceiveTimer (object):
 
 		self.holdtime = holdtime
 		self.last_print = 0
+		self.last_check = 0
 		self.last_read = int(time.time())
 
 		self.code = code
@@ -38,9 +39,13 @@ class ReceiveTimer (object):
 		now = int(time.time())
 		if message.TYPE != ignore:
 			self.last_read = now
+		elif now == self.last_check:
+			# nothing was received and the timer was already checked this second, it can not have expired since
+			return True
 		elapsed = now - self.last_read
 		if elapsed > self.holdtime:
 			raise Notify(self.code,self.subcode,self.message)
+		self.last_check = now
 		if self.last_print != now:
 			left = self.holdtime - elapsed
 			self.logger.debug('receive-timer %d second(s) left' % left,source='ka-'+self.session())
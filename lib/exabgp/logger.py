@@ -56,6 +56,18 @@ class LazyFormat (object):
 		return '%s (%4d) %s' % (self.prefix,len(self.message),formated)
 
 
+class LazyText (object):
+	def __init__ (self, template, *args):
+		self.template = template
+		self.args = args
+
+	def split (self, char):
+		return str(self).split(char)
+
+	def __str__ (self):
+		return self.template % self.args
+
+
 class LazyAttribute (object):
 	def __init__ (self, flag, aid, length, data):
 		self.flag = flag
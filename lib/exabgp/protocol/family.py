@@ -86,7 +86,10 @@ class AFI (Resource):
 
 	@staticmethod
 	def unpack (data):
-		return AFI.common.get(data,_AFI(unpack('!H',data)[0]))
+		afi = AFI.common.get(data,None)
+		if afi is not None:
+			return afi
+		return _AFI(unpack('!H',data)[0])
 
 	@classmethod
 	def value (cls,name):
@@ -110,7 +113,11 @@ class AFI (Resource):
 
 	@classmethod
 	def create (cls, value):
-		return cls.cache.get(value,_AFI(value))
+		# the default must not be built on every call, only when the value is unknown
+		afi = cls.cache.get(value,None)
+		if afi is not None:
+			return afi
+		return _AFI(value)
 
 
 # ======================================================================= SAFI
@@ -232,7 +239,10 @@ class SAFI (Resource):
 
 	@staticmethod
 	def unpack (data):
-		return SAFI.common.get(data,_SAFI(ordinal(data)))
+		safi = SAFI.common.get(data,None)
+		if safi is not None:
+			return safi
+		return _SAFI(ordinal(data))
 
 	@classmethod
 	def value (cls,name):
@@ -244,7 +254,10 @@ class SAFI (Resource):
 
 	@classmethod
 	def create (cls, value):
-		return cls.cache.get(value,_SAFI(value))
+		safi = cls.cache.get(value,None)
+		if safi is not None:
+			return safi
+		return _SAFI(value)
 
 
 # ===================================================================== FAMILY
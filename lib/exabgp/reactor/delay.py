@@ -27,3 +27,6 @@ class Delay (object):
 
 	def backoff (self):
 		return self._time > time.time()
+
+	def deadline (self):
+		return self._time
@@ -10,7 +10,9 @@ License: 3-clause BSD. (See the COPYRIGHT file)
 import os
 import uuid
 import copy
+import select
 import socket
+from collections import deque
 
 from exabgp.util.errstr import errstr
 
@@ -33,6 +35,8 @@ from exabgp.logger import Logger
 
 
 class Listener (object):
+	__slots__ = ['serving','logger','_reactor','_backlog','_sockets','_accepted','_poller']
+
 	_family_AFI_map = {
 		socket.AF_INET: AFI.ipv4,
 		socket.AF_INET6: AFI.ipv6,
@@ -44,8 +48,11 @@ class Listener (object):
 
 		self._reactor = reactor
 		self._backlog = backlog
+		# indexed by file descriptor, the socket is kept with its state
 		self._sockets = {}
-		self._accepted = {}
+		self._accepted = deque()
+		# only the listening sockets with a pending connection are looked at
+		self._poller = select.poll()
 
 	def _new_socket (self, ip):
 		if ip.afi == AFI.ipv6:
@@ -57,7 +64,7 @@ class Listener (object):
 	def _listen (self, local_ip, peer_ip, local_port, md5, md5_base64, ttl_in):
 		self.serving = True
 
-		for sock,(local,port,peer,md) in self._sockets.items():
+		for sock,local,port,peer,md in self._sockets.values():
 			if local_ip.top() != local:
 				continue
 			if local_port != port:
@@ -83,7 +90,8 @@ class Listener (object):
 			# s.settimeout(0.0)
 			sock.bind((local_ip.top(),local_port))
 			sock.listen(self._backlog)
-			self._sockets[sock] = (local_ip.top(),local_port,peer_ip.top(),md5)
+			self._sockets[sock.fileno()] = (sock,local_ip.top(),local_port,peer_ip.top(),md5)
+			self._poller.register(sock, select.POLLIN)
 		except socket.error as exc:
 			if exc.args[0] == errno.EADDRINUSE:
 				raise BindingError('could not listen on %s:%d, the port may already be in use by another application' % (local_ip,local_port))
@@ -116,24 +124,26 @@ class Listener (object):
 
 		peer_connected = False
 
-		for sock in self._sockets:
-			if sock in self._accepted:
-				continue
-			try:
-				io, _ = sock.accept()
-				self._accepted[sock] = io
-				peer_connected = True
-			except socket.error as exc:
-				if exc.errno in error.block:
-					continue
-				self.logger.critical(str(exc),'network')
+		for fd, _ in self._poller.poll(0):
+			sock = self._sockets[fd][0]
+			# drain the accept queue in one go, but do not starve the reactor during a connection storm
+			for _ in range(self._backlog):
+				try:
+					io, _ = sock.accept()
+					self._accepted.append((sock,io))
+					peer_connected = True
+				except socket.error as exc:
+					if exc.errno not in error.block:
+						self.logger.critical(str(exc),'network')
+					break
 
 		return peer_connected
 
 	def _connected (self):
-		try:
-			for sock,io in list(self._accepted.items()):
-				del self._accepted[sock]
+		while self._accepted:
+			sock,io = self._accepted.popleft()
+			# a connection which failed (reset by the peer, ...) must not prevent the others to be handled
+			try:
 				if sock.family == socket.AF_INET:
 					local_ip  = io.getpeername()[0]  # local_ip,local_port
 					remote_ip = io.getsockname()[0]  # remote_ip,remote_port
@@ -143,9 +153,12 @@ class Listener (object):
 				else:
 					raise AcceptError('unexpected address family (%d)' % sock.family)
 				fam = self._family_AFI_map[sock.family]
-				yield Incoming(fam,remote_ip,local_ip,io)
-		except NetworkError as exc:
-			self.logger.critical(str(exc),'network')
+				connection = Incoming(fam,remote_ip,local_ip,io)
+			except (socket.error,NetworkError) as exc:
+				self.logger.critical(str(exc),'network')
+				io.close()
+				continue
+			yield connection
 
 	def new_connections (self):
 		if not self.serving:
@@ -153,9 +166,10 @@ class Listener (object):
 		yield None
 
 		reactor = self._reactor
-		ranged_neighbor = []
 
+		# several connections may have been accepted at once, each is handled in turn
 		for connection in self._connected():
+			ranged_neighbor = []
 			self.logger.debug('new connection received %s' % connection.name(),'network')
 			for key in reactor.peers():
 				neighbor = reactor.neighbor(key)
@@ -195,12 +209,12 @@ class Listener (object):
 					self.logger.debug('could not accept connection from %s (more than one neighbor match)' % connection.name(),'network')
 					reactor.asynchronous.schedule(str(uuid.uuid1()), 'sending notification (6,5)', connection.notification(
 						6, 5, 'could not accept the connection (more than one neighbor match)'))
-					return
+					continue
 				if not matched:
 					self.logger.debug('no session configured for %s' % connection.name(),'network')
 					reactor.asynchronous.schedule(str(uuid.uuid1()), 'sending notification (6,3)', connection.notification(
 						6, 3, 'no session configured for the peer'))
-					return
+					continue
 
 				new_neighbor = copy.copy(ranged_neighbor[0])
 				new_neighbor.range_size = 1
@@ -214,16 +228,16 @@ class Listener (object):
 				denied = new_peer.handle_connection(connection)
 				if denied:
 					self.logger.debug('refused connection from %s due to the state machine' % connection.name(),'network')
-					return
+					continue
 
 				reactor.register_peer(new_neighbor.name(),new_peer)
-				return
 
 	def stop (self):
 		if not self.serving:
 			return
 
-		for sock,(ip,port,_,_) in self._sockets.items():
+		for fd,(sock,ip,port,_,_) in self._sockets.items():
+			self._poller.unregister(fd)
 			sock.close()
 			self.logger.info('stopped listening on %s:%d' % (ip,port),'network')
 
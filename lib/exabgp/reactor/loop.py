@@ -9,6 +9,7 @@ License: 3-clause BSD. (See the COPYRIGHT file)
 
 import time
 import uuid
+import heapq
 import select
 import socket
 
@@ -76,6 +77,9 @@ class Reactor (object):
 		self.api = API(self)
 
 		self._peers = {}
+		# peers waiting before trying to connect again, they are not run before their deadline
+		self._delayed = {}
+		self._deadlines = []
 
 		self._reload_processes = False
 		self._saved_pid = False
@@ -292,6 +296,8 @@ class Reactor (object):
 
 		workers = {}
 		peers = set()
+		# the peers with data waiting on their socket
+		readable = set()
 		api_fds = []
 
 		while True:
@@ -335,6 +341,12 @@ class Reactor (object):
 
 				sleep = self._sleep_time
 
+				now = time.time()
+				while self._deadlines and self._deadlines[0][0] <= now:
+					deadline, key = heapq.heappop(self._deadlines)
+					if self._delayed.get(key) == deadline:
+						del self._delayed[key]
+
 				# do not attempt to listen on closed sockets even if the peer is still here
 				for io in list(workers.keys()):
 					if io == -1:
@@ -350,6 +362,18 @@ class Reactor (object):
 						peers.discard(key)
 						continue
 
+					# still waiting to reconnect, unless the delay was reset (new connection, teardown, ...)
+					if key in self._delayed:
+						if self._delayed[key] == peer.delayed():
+							peers.discard(key)
+							continue
+						del self._delayed[key]
+
+					# an established session with nothing to do is only run when data is received
+					if key not in readable and peer.idle(now):
+						peers.discard(key)
+						continue
+
 					# handle the peer
 					action = peer.run()
 
@@ -360,9 +384,14 @@ class Reactor (object):
 					if action == ACTION.CLOSE:
 						if key in self._peers:
 							del self._peers[key]
+						self._delayed.pop(key,None)
 						peers.discard(key)
 					# we are loosing this peer, not point to schedule more process work
 					elif action == ACTION.LATER:
+						deadline = peer.delayed()
+						if deadline > now:
+							self._delayed[key] = deadline
+							heapq.heappush(self._deadlines,(deadline,key))
 						io = peer.socket()
 						if io != -1:
 							self._poller.register(io, select.POLLIN | select.POLLPRI | select.POLLHUP | select.POLLNVAL | select.POLLERR)
@@ -375,6 +404,8 @@ class Reactor (object):
 					if not peers:
 						break
 
+				readable = set()
+
 				# read at least on message per process if there is some and parse it
 				for service,command in self.processes.received():
 					self.api.text(self,service,command)
@@ -397,7 +428,7 @@ class Reactor (object):
 
 				for io in self._wait_for_io(sleep):
 					if io not in api_fds:
-						peers.add(workers[io])
+						readable.add(workers[io])
 
 				if self._stopping and not self._peers.keys():
 					self._termination('exiting on peer termination',self.Exit.normal)
@@ -9,10 +9,7 @@ License: 3-clause BSD. (See the COPYRIGHT file)
 
 import random
 import socket
-import select
-from struct import unpack
-
-from exabgp.util import ordinal
+from struct import Struct
 
 from exabgp.configuration.environment import environment
 
@@ -36,6 +33,9 @@ from exabgp.bgp.message.open.capability.extended import ExtendedMessage
 
 from .error import *
 
+# marker, length, type: the BGP header is decoded with one call
+_HEADER = Struct('!16sHB')
+
 
 class Connection (object):
 	direction = 'undefined'
@@ -58,8 +58,8 @@ class Connection (object):
 
 		self.io = None
 		self.established = False
-		self._rpoller = {}
-		self._wpoller = {}
+		# receive buffer (and its memoryview) reused from one read to the next
+		self._buffer = None
 
 		self.id = self.identifier.get(self.direction,1)
 
@@ -97,38 +97,6 @@ class Connection (object):
 		except Exception:
 			self.io = None
 
-	def reading (self):
-		poller = self._rpoller.get(self.io,None)
-		if poller is None:
-			poller = select.poll()
-			poller.register(self.io, select.POLLIN | select.POLLPRI | select.POLLHUP | select.POLLNVAL | select.POLLERR)
-			self._rpoller = {self.io: poller}
-
-		ready = False
-		for _, event in poller.poll(0):
-			if event & select.POLLIN or event & select.POLLPRI:
-				ready = True
-			elif event & select.POLLHUP or event & select.POLLERR or event & select.POLLNVAL:
-				self._rpoller = {}
-				ready = True
-		return ready
-
-	def writing (self):
-		poller = self._wpoller.get(self.io, None)
-		if poller is None:
-			poller = select.poll()
-			poller.register(self.io, select.POLLOUT| select.POLLHUP | select.POLLNVAL | select.POLLERR)
-			self._wpoller = {self.io: poller}
-
-		ready = False
-		for _, event in poller.poll(0):
-			if event & select.POLLOUT:
-				ready = True
-			elif event & select.POLLHUP or event & select.POLLERR or event & select.POLLNVAL:
-				self._wpoller = {}
-				ready = True
-		return ready
-
 	def _reader (self, number):
 		# The function must not be called if it does not return with no data with a smaller size as parameter
 		if not self.io:
@@ -138,9 +106,15 @@ class Connection (object):
 			yield b''
 			return
 
-		while not self.reading():
-			yield b''
-		data = b''
+		# no poll() before recv(), when nothing is pending we get EAGAIN for the same one system call
+		# the buffer is filled in place, rather than concatenating each recv(), and reused by the next read
+		# it is taken while in use, so if this read is abandoned, the next one allocates a new one
+		buffer, self._buffer = self._buffer, None
+		if buffer is None or len(buffer[0]) < number:
+			array = bytearray(max(number,self.msg_size))
+			buffer = (array,memoryview(array))
+		view = buffer[1]
+		read = 0
 		reported = ''
 		while True:
 			try:
@@ -148,15 +122,16 @@ class Connection (object):
 					if self.defensive and random.randint(0,2):
 						raise socket.error(errno.EAGAIN,'raising network error on purpose')
 
-					read = self.io.recv(number)
-					if not read:
+					received = self.io.recv_into(view[read:number])
+					if not received:
 						self.close()
 						self.logger.warning('%s %s lost TCP session with peer' % (self.name(),self.peer),self.session())
 						raise LostConnection('the TCP connection was closed by the remote end')
-					data += read
 
-					number -= len(read)
-					if not number:
+					read += received
+					if read == number:
+						data = view[:number].tobytes()
+						self._buffer = buffer
 						self.logger.debug(LazyFormat('received TCP payload',data),self.session())
 						yield data
 						return
@@ -169,7 +144,7 @@ class Connection (object):
 			except socket.error as exc:
 				if exc.args[0] in error.block:
 					message = '%s %s blocking io problem mid-way through reading a message %s, trying to complete' % (self.name(),self.peer,errstr(exc))
-					if message != reported:
+					if read and message != reported:
 						reported = message
 						self.logger.debug(message,self.session())
 					yield b''
@@ -186,9 +161,9 @@ class Connection (object):
 			# XXX: FIXME: Make sure it does not hold the cleanup during the closing of the peering session
 			yield True
 			return
-		while not self.writing():
-			yield False
 		self.logger.debug(LazyFormat('sending TCP payload',data),self.session())
+		# a partial send() moves the view forward instead of copying what is left of the data
+		data = memoryview(data)
 		# The first while is here to setup the try/catch block once as it is very expensive
 		while True:
 			try:
@@ -239,14 +214,13 @@ class Connection (object):
 			if not header:
 				yield 0,0,b'',b'',None
 
-		if not header.startswith(Message.MARKER):
+		marker,length,msg = _HEADER.unpack(header)
+
+		if marker != Message.MARKER:
 			report = 'The packet received does not contain a BGP marker'
 			yield 0,0,header,b'',NotifyError(1,1,report)
 			return
 
-		msg = ordinal(header[18])
-		length = unpack('!H',header[16:18])[0]
-
 		if length < Message.HEADER_LEN or length > self.msg_size:
 			report = '%s has an invalid message length of %d' % (Message.CODE.name(msg),length)
 			yield length,0,header,b'',NotifyError(1,2,report)
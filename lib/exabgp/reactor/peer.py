@@ -12,7 +12,6 @@ from collections import defaultdict
 
 # import traceback
 from exabgp.vendoring import six
-from exabgp.util import ordinal
 from exabgp.bgp.timer import ReceiveTimer
 from exabgp.bgp.message import Message
 from exabgp.bgp.fsm import FSM
@@ -70,10 +69,26 @@ class Interrupted (Exception):
 class Stop (Exception):
 	pass
 
+
+# How the peer loop is closed when it is left on an exception (Notify is handled on its own as it is sent to the peer)
+# exception: (stop if we can only connect once, (reset message, reset error))
+EXIT = {
+	NetworkError: (True,  lambda exc: ('closing connection',exc)),
+	Notification: (True,  lambda exc: ('notification received (%d,%d)' % (exc.code,exc.subcode),exc)),
+	Message:      (False, lambda exc: ('unexpected message received',exc)),
+	ProcessError: (False, lambda exc: ('process problem',exc)),
+	Interrupted:  (False, lambda exc: ('connection received before we could fully establish one','')),
+}
+
 # ======================================================================== Peer
 # Present a File like interface to socket.socket
 
 class Peer (object):
+	__slots__ = [
+		'logger','once','bind','reactor','neighbor','_neighbor','proto','fsm','stats','generator',
+		'_restart','_restarted','_reconfigure','_resend_routes','_teardown','_delay','recv_timer','_idle',
+	]
+
 	def __init__ (self, neighbor, reactor):
 		try:
 			self.logger = Logger()
@@ -118,6 +133,9 @@ class Peer (object):
 		self._delay = Delay()
 		self.recv_timer = None
 
+		# until when the established session has nothing to do, unless a message is received
+		self._idle = 0
+
 	def id (self):
 		return 'peer-%s' % self.neighbor.uid
 
@@ -136,6 +154,7 @@ class Peer (object):
 				message = u"peer reset, message [{0}] error[{1}]".format(message, msg_err)
 			self.proto.close(message)
 		self._delay.increase()
+		self._idle = 0
 
 		self.proto = None
 
@@ -154,6 +173,7 @@ class Peer (object):
 
 	def _stop (self, message):
 		self.generator = None
+		self._idle = 0
 		if self.proto:
 			self.proto.close('stop, message [%s]' % message)
 			self.proto = None
@@ -211,6 +231,21 @@ class Peer (object):
 		self._teardown = code
 		self._delay.reset()
 
+	def delayed (self):
+		# the time before which we will not try to connect again
+		return self._delay.deadline()
+
+	def idle (self, now):
+		# the session is waiting for data, there is nothing to send and the timers were checked this second
+		if not self._idle or not self.generator:
+			return False
+		if self._teardown or self._reconfigure or self._resend_routes != SEND.DONE:
+			return False
+		neighbor = self.neighbor
+		if neighbor.rib.outgoing.pending() or neighbor.messages or neighbor.refresh or neighbor.eor:
+			return False
+		return now < self._idle
+
 	def socket (self):
 		if self.proto:
 			return self.proto.fd()
@@ -289,15 +324,17 @@ class Peer (object):
 				raise Interrupted()
 
 	def _send_open (self):
-		message = Message.CODE.NOP
+		nop = Message.CODE.NOP
+		message = nop
 		for message in self.proto.new_open():
-			if ordinal(message.TYPE) == Message.CODE.NOP:
+			if message.ID == nop:
 				yield ACTION.NOW
 		yield message
 
 	def _read_open (self):
 		wait = environment.settings().bgp.openwait
 		opentimer = ReceiveTimer(self.proto.connection.session,wait,1,1,'waited for open too long, we do not like stuck in active')
+		nop = Message.CODE.NOP
 		# Only yield if we have not the open, otherwise the reactor can run the other connection
 		# which would be bad as we need to do the collission check without going to the other peer
 		for message in self.proto.read_open(self.neighbor.peer_address.top()):
@@ -305,7 +342,7 @@ class Peer (object):
 			# XXX: FIXME: change the whole code to use the ord and not the chr version
 			# Only yield if we have not the open, otherwise the reactor can run the other connection
 			# which would be bad as we need to do the collission check
-			if ordinal(message.TYPE) == Message.CODE.NOP:
+			if message.ID == nop:
 				# If a peer does not reply to OPEN message, or not enough bytes
 				# yielding ACTION.NOW can cause ExaBGP to busy spin trying to
 				# read from peer. See GH #723 .
@@ -326,10 +363,10 @@ class Peer (object):
 		# try to establish the outgoing connection
 		self.fsm.change(FSM.ACTIVE)
 
+		# _connect only ever yields ACTION, no need to filter them
 		if not self.proto:
 			for action in self._connect():
-				if action in ACTION.ALL:
-					yield action
+				yield action
 		self.fsm.change(FSM.CONNECT)
 
 		# normal sending of OPEN first ...
@@ -409,17 +446,32 @@ class Peer (object):
 
 		send_ka = KA(self.proto.connection.session,self.proto)
 
+		# bound once as they are compared against every message received
+		update_id = Update.ID
+		refresh_id = RouteRefresh.ID
+		refresh_request = RouteRefresh.request
+		nop_id = NOP.ID
+
+		# the keepalive timer has a resolution of one second: when nothing is received (NOP) and no keepalive
+		# is being sent, there is no need to look at it more than once per second
+		second = 0
+		sending = False
+
 		while not self._teardown:
 			for message in self.proto.read_message():
 				self.recv_timer.check_ka(message)
 
-				if send_ka() is not False:
-					# we need and will send a keepalive
-					while send_ka() is None:
-						yield ACTION.NOW
+				now = int(time.time())
+				if sending or now != second or message.ID != nop_id:
+					second = now
+					sending = send_ka() is not False
+					if sending:
+						# we need and will send a keepalive
+						while send_ka() is None:
+							yield ACTION.NOW
 
 				# Received update
-				if message.TYPE == Update.TYPE:
+				if message.ID == update_id:
 					number += 1
 					self.logger.debug('<< UPDATE #%d' % number,self.id())
 
@@ -427,8 +479,8 @@ class Peer (object):
 						self.neighbor.rib.incoming.update_cache(Change(nlri,message.attributes))
 						self.logger.debug(LazyFormat('   UPDATE #%d nlri ' % number,nlri,str),self.id())
 
-				elif message.TYPE == RouteRefresh.TYPE:
-					if message.reserved == RouteRefresh.request:
+				elif message.ID == refresh_id:
+					if message.reserved == refresh_request:
 						self._resend_routes = SEND.REFRESH
 						send_families.append((message.afi,message.safi))
 
@@ -512,14 +564,19 @@ class Peer (object):
 					except StopIteration:
 						command_eor = None
 
-				if new_routes or message.TYPE != NOP.TYPE:
+				if new_routes or message.ID != nop_id:
 					yield ACTION.NOW
 				elif self.neighbor.messages or operational:
 					yield ACTION.NOW
 				elif self.neighbor.eor or command_eor:
 					yield ACTION.NOW
 				else:
+					# nothing more to do before the timers need checking again, or a message is received
+					# unless a route refresh is still being written or a keepalive was just sent
+					if not refresh and not sending:
+						self._idle = second + 1
 					yield ACTION.LATER
+					self._idle = 0
 
 				# read_message will loop until new message arrives with NOP
 				if self._teardown:
@@ -543,16 +600,6 @@ class Peer (object):
 			for action in self._main():
 				yield action
 
-		# CONNECTION FAILURE
-		except NetworkError as network:
-			# we tried to connect once, it failed and it was not a manual request, we stop
-			if self.once and not self._teardown:
-				self.logger.debug('only one attempt to connect is allowed, stopping the peer',self.id())
-				self.stop()
-
-			self._reset('closing connection',network)
-			return
-
 		# NOTIFY THE PEER OF AN ERROR
 		except Notify as notify:
 			if self.proto:
@@ -571,38 +618,18 @@ class Peer (object):
 				self._reset()
 			return
 
-		# THE PEER NOTIFIED US OF AN ERROR
-		except Notification as notification:
-			# we tried to connect once, it failed and it was not a manual request, we stop
-			if self.once and not self._teardown:
-				self.logger.debug('only one attempt to connect is allowed, stopping the peer',self.id())
-				self.stop()
-
-			self._reset(
-				'notification received (%d,%d)' % (
-					notification.code,
-					notification.subcode),
-				notification
-			)
-			return
-
-		# RECEIVED a Message TYPE we did not expect
-		except Message as message:
-			self._reset('unexpected message received',message)
-			return
-
-		# PROBLEM WRITING TO OUR FORKED PROCESSES
-		except ProcessError as process:
-			self._reset('process problem',process)
-			return
-
-		# ....
-		except Interrupted as interruption:
-			self._reset('connection received before we could fully establish one')
+		# CONNECTION FAILURE, THE PEER NOTIFIED US OF AN ERROR, UNEXPECTED MESSAGE, ...
+		except Exception as exc:
+			self._exit(exc)
 			return
 
-		# UNHANDLED PROBLEMS
-		except Exception as exc:
+	def _exit (self, exc):
+		for klass in type(exc).__mro__:
+			if klass in EXIT:
+				once, reason = EXIT[klass]
+				break
+		else:
+			# UNHANDLED PROBLEMS
 			# Those messages can not be filtered in purpose
 			self.logger.debug('\n'.join([
 				NO_PANIC,
@@ -615,6 +642,14 @@ class Peer (object):
 			]),'reactor')
 			self._reset()
 			return
+
+		# we tried to connect once, it failed and it was not a manual request, we stop
+		if once and self.once and not self._teardown:
+			self.logger.debug('only one attempt to connect is allowed, stopping the peer',self.id())
+			self.stop()
+
+		self._reset(*reason(exc))
+
 	# loop
 
 	def run (self):
@@ -32,7 +32,6 @@ from exabgp.bgp.message.open.capability import Negotiated
 from exabgp.bgp.message import Update
 from exabgp.bgp.message import EOR
 from exabgp.bgp.message import KeepAlive
-from exabgp.bgp.message import Notification
 from exabgp.bgp.message import Notify
 from exabgp.bgp.message import Operational
 
@@ -47,6 +46,8 @@ from exabgp.logger import FakeLogger
 
 # This is the number of chuncked message we are willing to buffer, not the number of routes
 MAX_BACKLOG = 15000
+# UPDATEs are grouped and written with one send() up to this size, rather than one send() per UPDATE
+MAX_BATCH = 64 * 1024
 
 _UPDATE = Update([],b'')
 _OPERATIONAL = Operational(0x00)
@@ -165,15 +166,22 @@ class Protocol (object):
 		for boolean in self.connection.writer(raw):
 			yield boolean
 
-	def send (self, raw):
+	def _sent (self, raw):
 		code = 'send-%s' % Message.CODE.short(ordinal(raw[18]))
 		self.peer.stats[code] = self.peer.stats.get(code,0) + 1
 		if self.neighbor.api.get(code,False):
 			message = Update.unpack_message(raw[19:],self.negotiated)
 			self._to_api('send',message,raw)
 
-		for boolean in self.connection.writer(raw):
-			yield boolean
+	def _send (self, messages):
+		for written in self.connection.writer(b''.join(messages)):
+			if written:
+				break
+			# a transient network error we already announced
+			yield _NOP
+		# the messages are only accounted for and reported once written
+		for message in messages:
+			self._sent(message)
 
 	# Read from network .......................................................
 
@@ -231,7 +239,7 @@ class Protocol (object):
 				raise Notify(1,0,'can not decode update message of type "%d"' % msg_id)
 				# raise Notify(5,0,'unknown message received')
 
-			if message.TYPE == Update.TYPE:
+			if msg_id == Message.CODE.UPDATE:
 				if Attribute.CODE.INTERNAL_TREAT_AS_WITHDRAW in message.attributes:
 					for nlri in message.nlris:
 						nlri.action = IN.WITHDRAWN
@@ -243,10 +251,10 @@ class Protocol (object):
 				elif parsed:
 					self.peer.reactor.processes.message(msg_id,self.neighbor,'receive',message,negotiated,b'',b'')
 
-			if message.TYPE == Notification.TYPE:
+			if msg_id == Message.CODE.NOTIFICATION:
 				raise message
 
-			if message.TYPE == Update.TYPE and Attribute.CODE.INTERNAL_DISCARD in message.attributes:
+			if msg_id == Message.CODE.UPDATE and Attribute.CODE.INTERNAL_DISCARD in message.attributes:
 				yield _NOP
 			else:
 				yield message
@@ -337,13 +345,27 @@ class Protocol (object):
 
 	def new_update (self, include_withdraw):
 		updates = self.neighbor.rib.outgoing.updates(self.neighbor.group_updates)
+		# when rate limited, each UPDATE must be sent on its own
+		batch = 0 if self.neighbor.rate_limit > 0 else MAX_BATCH
 		number = 0
+		pending = []
+		size = 0
 		for update in updates:
 			for message in update.messages(self.negotiated,include_withdraw):
 				number += 1
-				for boolean in self.send(message):
-					# boolean is a transient network error we already announced
+				pending.append(message)
+				size += len(message)
+				if size < batch:
+					# each UPDATE still gives the hand back to the reactor, only the write is grouped
+					yield _NOP
+					continue
+				for _ in self._send(pending):
 					yield _NOP
+				pending = []
+				size = 0
+		if pending:
+			for _ in self._send(pending):
+				yield _NOP
 		if number:
 			self.logger.debug('>> %d UPDATE(s)' % number,self.connection.session())
 		yield _UPDATE
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+listener_test.py
+
+Copyright (c) 2009-2017 Exa Networks. All rights reserved.
+License: 3-clause BSD. (See the COPYRIGHT file)
+"""
+
+import time
+import struct
+import socket
+import unittest
+
+from exabgp.protocol.ip import IP
+from exabgp.reactor.listener import Listener
+
+from exabgp.configuration.setup import environment
+environment.setup('')
+
+
+class FakeAsynchronous (object):
+	def __init__ (self):
+		self.scheduled = []
+
+	def schedule (self, uid, command, callback):
+		self.scheduled.append(command)
+
+
+class FakeReactor (object):
+	# no peer is configured, so every connection is refused with a notification
+	def __init__ (self):
+		self.asynchronous = FakeAsynchronous()
+
+	def peers (self):
+		return []
+
+
+class TestListener (unittest.TestCase):
+	def setUp (self):
+		self.reactor = FakeReactor()
+		self.listener = Listener(self.reactor)
+		self.assertTrue(self.listener.listen_on(IP.create('127.0.0.1'),IP.create('127.0.0.1'),0,None,False,None))
+		sock = list(self.listener._sockets.values())[0][0]
+		self.address = sock.getsockname()
+		self.clients = []
+
+	def tearDown (self):
+		for client in self.clients:
+			client.close()
+		self.listener.stop()
+
+	def _connect (self, number):
+		for _ in range(number):
+			self.clients.append(socket.create_connection(self.address))
+		time.sleep(0.1)
+
+	def _new_connections (self):
+		return [_ for _ in self.listener.new_connections() if _ is not None]
+
+	def test_1_all_accepted (self):
+		self._connect(3)
+		self.assertTrue(self.listener.incoming())
+		self.assertEqual(len(self.listener._accepted),3)
+		self._new_connections()
+		self.assertEqual(len(self.listener._accepted),0)
+		self.assertEqual(len(self.reactor.asynchronous.scheduled),3)
+
+	def test_2_reset_connection (self):
+		self._connect(3)
+		# the first connection is reset before it is handled
+		first = self.clients.pop(0)
+		first.setsockopt(socket.SOL_SOCKET,socket.SO_LINGER,struct.pack('ii',1,0))
+		first.close()
+		time.sleep(0.1)
+		self.assertTrue(self.listener.incoming())
+		self._new_connections()
+		self.assertEqual(len(self.listener._accepted),0)
+		self.assertEqual(len(self.reactor.asynchronous.scheduled),2)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+reader_test.py
+
+Copyright (c) 2009-2017 Exa Networks. All rights reserved.
+License: 3-clause BSD. (See the COPYRIGHT file)
+"""
+
+import socket
+import unittest
+
+from exabgp.vendoring import six
+
+from exabgp.protocol.family import AFI
+from exabgp.bgp.message import Message
+from exabgp.reactor.network.connection import Connection
+
+from exabgp.configuration.environment import environment
+environment.setup('')
+
+
+def _hex (data):
+	return b''.join(six.int2byte(int(_,16)) for _ in data.split())
+
+
+KEEPALIVE = _hex('FF FF FF FF FF FF FF FF FF FF FF FF FF FF FF FF 00 13 04')
+OPEN = _hex('FF FF FF FF FF FF FF FF FF FF FF FF FF FF FF FF 00 1D 01 04 78 14 00 5A 52 DB 00 45 00')
+
+
+class TestReader (unittest.TestCase):
+	def setUp (self):
+		self.local, self.remote = socket.socketpair()
+		self.local.setblocking(0)
+		self.connection = Connection(AFI.ipv4,'127.0.0.1','127.0.0.1')
+		self.connection.io = self.local
+
+	def tearDown (self):
+		self.connection.close()
+		self.local.close()
+		self.remote.close()
+
+	def _read (self, reader, chunks):
+		# feed the data in pieces, and let the reader consume each piece before sending the next
+		for chunk in chunks:
+			self.remote.send(chunk)
+			for _ in range(20):
+				length,msg,header,body,notify = six.next(reader)
+				if length or notify:
+					return length,msg,header,body,notify
+		for _ in range(100):
+			length,msg,header,body,notify = six.next(reader)
+			if length or notify:
+				return length,msg,header,body,notify
+		self.fail('the reader did not return the message')
+
+	def test_1_header_split (self):
+		length,msg,header,body,notify = self._read(self.connection.reader(),[KEEPALIVE[:10],KEEPALIVE[10:17],KEEPALIVE[17:]])
+		self.assertEqual(notify,None)
+		self.assertEqual(length,19)
+		self.assertEqual(msg,4)
+		self.assertEqual(header,KEEPALIVE)
+		self.assertEqual(body,b'')
+
+	def test_2_length_split (self):
+		length,msg,header,body,notify = self._read(self.connection.reader(),[OPEN[:17],OPEN[17:24],OPEN[24:]])
+		self.assertEqual(notify,None)
+		self.assertEqual(length,29)
+		self.assertEqual(msg,1)
+		self.assertEqual(header,OPEN[:Message.HEADER_LEN])
+		self.assertEqual(body,OPEN[Message.HEADER_LEN:])
+
+	def test_3_invalid_marker (self):
+		invalid = b'\x00' + KEEPALIVE[1:]
+		length,msg,header,body,notify = self._read(self.connection.reader(),[invalid])
+		self.assertEqual((notify.code,notify.subcode),(1,1))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+writer_test.py
+
+Copyright (c) 2009-2017 Exa Networks. All rights reserved.
+License: 3-clause BSD. (See the COPYRIGHT file)
+"""
+
+import socket
+import unittest
+from struct import pack
+
+from exabgp.vendoring import six
+
+from exabgp.protocol.family import AFI
+from exabgp.bgp.message import Message
+from exabgp.reactor.protocol import Protocol
+from exabgp.reactor.network.connection import Connection
+
+from exabgp.configuration.setup import environment
+environment.setup('')
+
+
+def _update (index, size):
+	# a (not parsed) UPDATE of the given size, its body is made of its index
+	body = six.int2byte(index % 256) * (size - Message.HEADER_LEN)
+	return Message.MARKER + pack('!HB',size,Message.CODE.UPDATE) + body
+
+
+class FakeUpdate (object):
+	def __init__ (self, messages):
+		self._messages = messages
+
+	def messages (self, negotiated, include_withdraw):
+		for message in self._messages:
+			yield message
+
+
+class FakeOutgoing (object):
+	def __init__ (self, updates):
+		self._updates = updates
+
+	def updates (self, grouped):
+		return self._updates
+
+
+class FakeRIB (object):
+	def __init__ (self, updates):
+		self.outgoing = FakeOutgoing(updates)
+
+
+class FakeNeighbor (object):
+	connect = 0
+	adj_rib_in = False
+	group_updates = True
+	rate_limit = 0
+
+	def __init__ (self, updates):
+		self.api = {}
+		self.rib = FakeRIB(updates)
+
+
+class FakePeer (object):
+	def __init__ (self, neighbor):
+		self.neighbor = neighbor
+		self.stats = {}
+
+
+class TestWriter (unittest.TestCase):
+	def setUp (self):
+		self.local, self.remote = socket.socketpair()
+		self.local.setblocking(0)
+		self.remote.setblocking(0)
+		# a small send buffer so that the data can only be written in several parts
+		self.local.setsockopt(socket.SOL_SOCKET,socket.SO_SNDBUF,4096)
+		self.connection = Connection(AFI.ipv4,'127.0.0.1','127.0.0.1')
+		self.connection.io = self.local
+		self.received = b''
+
+	def tearDown (self):
+		self.connection.close()
+		self.local.close()
+		self.remote.close()
+
+	def _drain (self):
+		while True:
+			try:
+				data = self.remote.recv(65536)
+			except socket.error:
+				return
+			if not data:
+				return
+			self.received += data
+
+	def test_1_partial_write (self):
+		data = b''.join(six.int2byte(_ % 251) for _ in range(256 * 1024))
+		partial = 0
+		for written in self.connection.writer(data):
+			if not written:
+				partial += 1
+			self._drain()
+		self._drain()
+		self.assertTrue(partial > 0)
+		self.assertEqual(self.received,data)
+
+	def test_2_grouped_updates (self):
+		messages = [_update(index,1000) for index in range(200)]
+		updates = [FakeUpdate(messages[_:_ + 10]) for _ in range(0,200,10)]
+		peer = FakePeer(FakeNeighbor(updates))
+		protocol = Protocol(peer)
+		protocol.connection = self.connection
+
+		nops = 0
+		for message in protocol.new_update(True):
+			if message.ID == Message.CODE.NOP:
+				nops += 1
+			# the first UPDATEs are queued, not written, so not accounted for yet
+			if nops == 1:
+				self.assertEqual(peer.stats.get('send-update',0),0)
+				self.assertEqual(self.received,b'')
+			self._drain()
+		self._drain()
+
+		# the reactor is given the hand back at least once per UPDATE
+		self.assertTrue(nops >= len(messages))
+		self.assertEqual(peer.stats['send-update'],len(messages))
+		self.assertEqual(self.received,b''.join(messages))
+
+
+if __name__ == '__main__':
+	unittest.main()